@@ -6,7 +6,6 @@ simulation output data, including energy levels, electric fields,
 and carrier densities.
 """
 
-import csv
 from pathlib import Path
 
 import numpy as np
@@ -18,21 +17,18 @@ class OutputData:
 
     This class reads the output file from a 1D Poisson simulation and
     provides access to various physical quantities through properties.
-
-    Attributes:
-        _FIELD_NAMES: Expected column names in the output file.
     """
 
-    _FIELD_NAMES = (
-        "Y (ang)",
-        "Ec (eV)",
-        "Ev (eV)",
-        "E (V/cm)",
-        "Ef (eV)",
-        "n (cm-3)",
-        "p (cm-3)",
-        "Nd - Na (cm-3)",
-        "el eval 1 (eV)",
+    __slots__ = (
+        "_z",
+        "_energy_conduction",
+        "_energy_valence",
+        "_electric_field",
+        "_energy_fermi",
+        "_density_electron",
+        "_density_hole",
+        "_energy_ground_state",
+        "_position_ground_state",
     )
 
     def __init__(self, output_file: str | Path) -> None:
@@ -48,82 +44,99 @@ class OutputData:
             ValueError: If the file format is invalid or required columns
                        are missing.
         """
-        z: list[float] = []
-        energy_conduction: list[float] = []
-        energy_valence: list[float] = []
-        electric_field: list[float] = []
-        energy_fermi: list[float] = []
-        density_electron: list[float] = []
-        density_hole: list[float] = []
+        arr = np.loadtxt(
+            output_file,
+            delimiter="\t",
+            skiprows=1,
+            usecols=range(8),
+        )
+
+        self._z = arr[:, 0] / 1e1
+        self._energy_conduction = arr[:, 1]
+        self._energy_valence = arr[:, 2]
+        self._electric_field = arr[:, 3]
+        self._energy_fermi = arr[:, 4]
+        self._density_electron = arr[:, 5]
+        self._density_hole = arr[:, 6]
+
+        self._parse_ground_state(output_file)
+
+    @classmethod
+    def from_file_minimal(cls, output_file: str | Path) -> "OutputData":
+        """
+        Create an OutputData with only the ground-state scalars parsed.
+
+        Reading stops at the first row that carries the eigenvalue
+        column, so the full-column arrays are never built; their
+        properties return None on the resulting instance. This is the
+        fast path for parameter sweeps that only need the ground state.
+
+        Args:
+            output_file: Path to the output file from 1D Poisson
+                        simulation.
+
+        Returns:
+            OutputData instance with only energy_ground_state and
+            position_ground_state populated.
+        """
+        data = cls.__new__(cls)
+        data._z = None
+        data._energy_conduction = None
+        data._energy_valence = None
+        data._electric_field = None
+        data._energy_fermi = None
+        data._density_electron = None
+        data._density_hole = None
+        data._parse_ground_state(output_file)
+        return data
+
+    def _parse_ground_state(self, output_file: str | Path) -> None:
+        # The eigenvalue column is blank on most rows, so it cannot go
+        # through np.loadtxt; scan for the first row that carries it.
         self._energy_ground_state: float | None = None
         self._position_ground_state: float | None = None
 
         with open(output_file, "rt") as f:
-            reader = csv.DictReader(
-                f,
-                fieldnames=self._FIELD_NAMES,
-                delimiter="\t",
-            )
-
-            for i, row in enumerate(reader):
-                if i == 0:
-                    continue
-
-                z.append(float(row["Y (ang)"]) / 1e1)
-                energy_conduction.append(float(row["Ec (eV)"]))
-                energy_valence.append(float(row["Ev (eV)"]))
-                electric_field.append(float(row["E (V/cm)"]))
-                energy_fermi.append(float(row["Ef (eV)"]))
-                density_electron.append(float(row["n (cm-3)"]))
-                density_hole.append(float(row["p (cm-3)"]))
-
-                if (
-                    row["el eval 1 (eV)"] is not None and
-                    self._energy_ground_state is None
-                ):
-                    self._energy_ground_state = float(row["el eval 1 (eV)"])
-                    self._position_ground_state = float(row["Y (ang)"]) / 1e1
-
-        self._z = np.array(z)
-        self._energy_conduction = np.array(energy_conduction)
-        self._energy_valence = np.array(energy_valence)
-        self._electric_field = np.array(electric_field)
-        self._energy_fermi = np.array(energy_fermi)
-        self._density_electron = np.array(density_electron)
-        self._density_hole = np.array(density_hole)
+            next(f, None)  # skip the header row
+            for line in f:
+                fields = line.rstrip("\n").split("\t")
+                if len(fields) > 8 and fields[8]:
+                    self._energy_ground_state = float(fields[8])
+                    self._position_ground_state = float(fields[0]) / 1e1
+                    break
 
     @property
-    def z(self) -> np.ndarray:
+    def z(self) -> np.ndarray | None:
         """Position coordinates in nanometers."""
         return self._z
 
     @property
-    def energy_conduction(self) -> np.ndarray:
+    def energy_conduction(self) -> np.ndarray | None:
         """Conduction band energy in eV."""
         return self._energy_conduction
 
     @property
-    def energy_valence(self) -> np.ndarray:
+    def energy_valence(self) -> np.ndarray | None:
         """Valence band energy in eV."""
         return self._energy_valence
 
     @property
-    def electric_field(self) -> np.ndarray:
+    def electric_field(self) -> np.ndarray | None:
         """Electric field in V/cm."""
         return self._electric_field
 
     @property
-    def energy_fermi(self) -> np.ndarray:
+    def energy_fermi(self) -> np.ndarray | None:
         """Fermi energy in eV."""
         return self._energy_fermi
 
     @property
-    def density_electron(self) -> np.ndarray:
+    def density_electron(self) -> np.ndarray | None:
         """Electron density in cm^-3."""
         return self._density_electron
 
     @property
-    def density_hole(self) -> np.ndarray:
+    def density_hole(self) -> np.ndarray | None:
         """Hole density in cm^-3."""
         return self._density_hole
 
@@ -9,6 +9,13 @@ from pydantic import BaseModel, field_validator
 from pathlib import Path
 import yaml
 
+try:
+    # C-implemented parser from libyaml; much faster than the
+    # pure-Python SafeLoader it falls back to.
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 
 class Array(BaseModel):
     """
@@ -95,5 +102,5 @@ def load_simulation_config(file_path: str) -> SimulationConfig:
         ValidationError: If the configuration data is invalid.
     """
     with open(file_path, "r") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_SafeLoader)
     return SimulationConfig(**data)
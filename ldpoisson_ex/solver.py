@@ -5,17 +5,23 @@ This module provides the main solver class and parameter management
 for running 1D Poisson simulations across multiple parameter combinations.
 """
 
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
 import itertools
 import logging
+import math
 import os
 from pathlib import Path
+import re
 import shutil
 import subprocess as sp
+import tempfile
 import typing as t
 
 from jinja2 import (
     Environment,
+    FileSystemBytecodeCache,
     FileSystemLoader,
     select_autoescape,
 )
@@ -53,16 +59,30 @@ class ParamsManager:
         for const in constants:
             self._constants[const.name] = const.value
 
-        self._variables: dict[str, list[float]] = {}
+        self._variables: dict[str, np.ndarray] = {}
         for var in variables:
             if isinstance(var.value, list):
-                self._variables[var.name] = var.value
+                self._variables[var.name] = np.asarray(
+                    var.value,
+                    dtype=np.float64,
+                )
             else:
-                self._variables[var.name] = list(np.arange(
-                    var.value.start,
-                    var.value.end,
-                    var.value.step,
+                # np.linspace keeps the grid length deterministic;
+                # np.arange with float steps can gain or lose the last
+                # point to accumulated rounding error. Like arange,
+                # take the ceiling of the ratio, rounded just enough
+                # beforehand to absorb FP drift without dropping
+                # legitimate in-range points.
+                num = math.ceil(round(
+                    (var.value.end - var.value.start) / var.value.step,
+                    9,
                 ))
+                self._variables[var.name] = np.linspace(
+                    var.value.start,
+                    var.value.start + num * var.value.step,
+                    num,
+                    endpoint=False,
+                )
 
         self._variable_formats: dict[str, str] = {
             var.name: var.format for var in variables
@@ -74,8 +94,8 @@ class ParamsManager:
         return self._constants
 
     @property
-    def variables(self) -> dict[str, list[float]]:
-        """Dictionary of variable parameters and their value lists."""
+    def variables(self) -> dict[str, np.ndarray]:
+        """Dictionary of variable parameters and their value arrays."""
         return self._variables
 
     @property
@@ -97,8 +117,16 @@ class ParamsManager:
 
         var_names = list(self._variables.keys())
         var_values = [self._variables[name] for name in var_names]
+
+        # Fill one pre-sized dict in place and snapshot it with
+        # dict.copy, which is cheaper than rebuilding the mapping via
+        # dict(zip(...)) on every combination. The copy is required
+        # because run() retains the yielded mappings in its executor.
+        out = dict.fromkeys(var_names)
         for combination in itertools.product(*var_values):
-            yield dict(zip(var_names, combination))
+            for name, value in zip(var_names, combination, strict=True):
+                out[name] = value
+            yield out.copy()
 
     @cached_property
     def shape_variables(self) -> tuple[int, ...]:
@@ -133,9 +161,33 @@ class lDPoissonExSolver:
         self._env = Environment(
             loader=FileSystemLoader(Path(config.file_template).parent),
             autoescape=select_autoescape(),
+            bytecode_cache=FileSystemBytecodeCache(),
         )
         self._template = self._env.get_template(config.file_template.name)
 
+        # A template that is pure variable substitution can have the
+        # constants rendered in once, leaving only the variable
+        # placeholders for the per-combination renders. Templates that
+        # use variables in expressions or control flow must keep the
+        # full per-call render: substituting placeholder strings into
+        # them would corrupt the expressions. Flatness is judged on
+        # the original source, before any substitution.
+        source, _, _ = self._env.loader.get_source(
+            self._env, config.file_template.name
+        )
+        if self._is_flat_template(source):
+            placeholders = {
+                name: "{{ " + name + " }}"
+                for name in self._params_manager.variables
+            }
+            self._template_str = self._make_format_template(
+                self._template.render(
+                    self._params_manager.constants | placeholders
+                )
+            )
+        else:
+            self._template_str = None
+
         # Set up logging
         if self._config.log_file is None:
             logging_handler = logging.StreamHandler()
@@ -146,6 +198,42 @@ class lDPoissonExSolver:
         self._logger.setLevel(logging.INFO)
         self._logger.addHandler(logging_handler)
 
+    _PLACEHOLDER_RE = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+    @classmethod
+    def _is_flat_template(cls, source: str) -> bool:
+        # True when the template is nothing but plain '{{ name }}'
+        # placeholders, with no expressions or control flow.
+        residue = cls._PLACEHOLDER_RE.sub("", source)
+        return not (
+            "{{" in residue or "{%" in residue or "{#" in residue
+        )
+
+    @classmethod
+    def _make_format_template(cls, source: str) -> str:
+        # Translate a flat Jinja template into a str.format template
+        # ('{{ name }}' -> '{name}', literal braces escaped). Callers
+        # must establish flatness with _is_flat_template on the
+        # original, unsubstituted source; judging it here, after the
+        # constants are rendered in, would be too late to reject
+        # templates whose expressions were already mangled.
+        parts = []
+        last = 0
+        for match in cls._PLACEHOLDER_RE.finditer(source):
+            literal = source[last:match.start()]
+            parts.append(literal.replace("{", "{{").replace("}", "}}"))
+            parts.append("{" + match.group(1) + "}")
+            last = match.end()
+        parts.append(source[last:].replace("{", "{{").replace("}", "}}"))
+        return "".join(parts)
+
+    def _render_input(self, variables: dict[str, float]) -> str:
+        if self._template_str is not None:
+            return self._template_str.format_map(variables)
+        return self._template.render(
+            ChainMap(variables, self._params_manager.constants)
+        )
+
     def _get_dir_name(self, variables: dict[str, float]) -> str:
         results = []
         for k, v in variables.items():
@@ -155,90 +243,117 @@ class lDPoissonExSolver:
 
     def _run_single(
         self,
-        constants: dict[str, float],
         variables: dict[str, float],
     ) -> OutputData:
         # Create input file
         path_app = self._config.path_1d_poisson
         input_file_name = self._get_dir_name(variables)
-        input_file = path_app.parent / f"{input_file_name}.txt"
+        input_file = self._scratch_dir / f"{input_file_name}.txt"
 
-        self._logger.info(f"Creating input file: {input_file}")
+        self._logger.debug("Creating input file: %s", input_file)
         with open(input_file, "w") as f:
-            f.write(self._template.render(constants | variables))
+            f.write(self._render_input(variables))
 
         # Run 1D Poisson
-        self._logger.info(f"Running 1D Poisson simulation for: {variables}")
-        cwd = os.getcwd()
-        os.chdir(path_app.parent)
-        sp.run(f"\"{path_app}\" {input_file_name}")
-        os.chdir(cwd)
+        self._logger.debug("Running 1D Poisson simulation for: %s", variables)
+        sp.run(
+            [str(path_app), input_file_name],
+            cwd=str(self._scratch_dir),
+            check=True,
+            stdout=sp.DEVNULL,
+            stderr=sp.DEVNULL,
+        )
 
         # Create output directory
         dir_out_single = (self._config.dir_output / input_file_name)
-        self._logger.info(f"Creating output directory: {dir_out_single}")
-        os.makedirs(dir_out_single)
+        self._logger.debug("Creating output directory: %s", dir_out_single)
+        os.makedirs(dir_out_single, exist_ok=True)
 
         # Move output files
-        path_out = path_app.parent / f"{input_file_name}_Out.txt"
-        path_status = path_app.parent / f"{input_file_name}_Status.txt"
-        path_wave = path_app.parent / f"{input_file_name}_Wave.txt"
-
-        self._logger.info(f"Moving output files to: {dir_out_single}")
-        shutil.move(input_file, dir_out_single)
-        shutil.move(path_out, dir_out_single)
-        shutil.move(path_status, dir_out_single)
-        shutil.move(path_wave, dir_out_single)
-
-        return OutputData(dir_out_single / f"{input_file_name}_Out.txt")
+        path_out = self._scratch_dir / f"{input_file_name}_Out.txt"
+        path_status = self._scratch_dir / f"{input_file_name}_Status.txt"
+        path_wave = self._scratch_dir / f"{input_file_name}_Wave.txt"
+
+        self._logger.debug("Moving output files to: %s", dir_out_single)
+        for path in (input_file, path_out, path_status, path_wave):
+            try:
+                os.replace(path, dir_out_single / path.name)
+            except OSError:
+                # os.replace cannot cross filesystems; fall back to
+                # shutil.move, which copies and deletes in that case.
+                shutil.move(path, dir_out_single / path.name)
+
+        # The sweep only needs the ground-state scalars, so skip the
+        # full-column parse.
+        return OutputData.from_file_minimal(
+            dir_out_single / f"{input_file_name}_Out.txt"
+        )
 
     def run(self) -> None:
-        total_combinations = np.prod(self._params_manager.shape_variables)
+        total_combinations = math.prod(self._params_manager.shape_variables)
         self._logger.info(
-            f"Starting parameter sweep with {total_combinations} combinations"
+            "Starting parameter sweep with %d combinations",
+            total_combinations,
         )
-        self._logger.info(f"Variables: {self._params_manager.variables}")
-        self._logger.info(f"Constants: {self._params_manager.constants}")
-
-        # Run simulations
-        energies_ground_states = []
-        positions_ground_states = []
-        for i, variables in enumerate(
-            self._params_manager.generate_variables(), 1
-        ):
-            self._logger.info(
-                f"Processing combination {i}/{total_combinations}"
-            )
-            output = self._run_single(
-                self._params_manager.constants,
-                variables,
-            )
-            energies_ground_states.append(output.energy_ground_state)
-            positions_ground_states.append(output.position_ground_state)
+        self._logger.info("Variables: %s", self._params_manager.variables)
+        self._logger.info("Constants: %s", self._params_manager.constants)
+
+        # Scratch space for the per-combination input and output files.
+        # /dev/shm is RAM-backed where available, so the write/read
+        # cycle between this process and the simulator never touches
+        # storage; elsewhere the system temp directory is used. Final
+        # artifacts are still moved to dir_output.
+        shm = Path("/dev/shm")
+        self._scratch_dir = Path(tempfile.mkdtemp(
+            prefix="1dpoisson-ex-",
+            dir=shm if shm.is_dir() else None,
+        ))
+
+        # Run simulations concurrently; each combination is independent,
+        # and the work is dominated by the 1D Poisson subprocess.
+        shape_variables = self._params_manager.shape_variables
+        results = np.empty(
+            shape_variables,
+            dtype=[("energy", "f8"), ("position", "f8")],
+        )
+        try:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                futures = [
+                    executor.submit(self._run_single, variables)
+                    for variables in self._params_manager.generate_variables()
+                ]
+
+                for i, (index, future) in enumerate(
+                    zip(np.ndindex(*shape_variables), futures), 1
+                ):
+                    output = future.result()
+                    self._logger.info(
+                        "Completed combination %d/%d", i, total_combinations
+                    )
+                    results[index] = (
+                        output.energy_ground_state,
+                        output.position_ground_state,
+                    )
+        finally:
+            shutil.rmtree(self._scratch_dir, ignore_errors=True)
 
         self._logger.info("All simulations completed. Saving results...")
 
         # Save individual variable states
-        for var_name, var_values in self._params_manager._variables.items():
-            var_values = np.array(var_values)
+        for var_name, var_values in self._params_manager.variables.items():
             output_path = self._config.dir_output / f"{var_name}.npy"
             np.save(output_path, var_values)
-            self._logger.info(f"Saved variable '{var_name}' to {output_path}")
+            self._logger.info(
+                "Saved variable '%s' to %s", var_name, output_path
+            )
 
         # Save ground state energies and positions
-        energies_ground_states = np.array(energies_ground_states).reshape(
-            self._params_manager.shape_variables
+        ground_states_path = self._config.dir_output / "ground_states.npz"
+        np.savez(
+            ground_states_path,
+            energy=results["energy"],
+            position=results["position"],
         )
-        positions_ground_states = np.array(positions_ground_states).reshape(
-            self._params_manager.shape_variables
-        )
-
-        energy_path = self._config.dir_output / "energies_ground_states.npy"
-        position_path = self._config.dir_output / "positions_ground_states.npy"
-
-        np.save(energy_path, energies_ground_states)
-        np.save(position_path, positions_ground_states)
 
-        self._logger.info(f"Saved ground state energies to {energy_path}")
-        self._logger.info(f"Saved ground state positions to {position_path}")
+        self._logger.info("Saved ground states to %s", ground_states_path)
         self._logger.info("Parameter sweep completed successfully!")